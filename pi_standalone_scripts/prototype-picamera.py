@@ -2,19 +2,35 @@ import picamera
 import cv2
 import numpy as np
 import datetime
-import threading
-import queue
-
-def read_kbd_input(inputQueue):
+import sys
+import time
+import os
+import atexit
+import select
+import termios
+import tty
+
+def setup_kbd_input():
+  # Without a terminal (nohup, ssh without -t, a service) there is no keyboard to read, stop with Ctrl+C or SIGINT instead.
+  if not sys.stdin.isatty():
+    print('No terminal attached, keyboard input disabled')
+    return
+
+  # Put the terminal in cbreak mode so single key presses can be read without waiting for enter.
+  # The original settings are restored when the program exits.
+  fd = sys.stdin.fileno()
+  atexit.register(termios.tcsetattr, fd, termios.TCSADRAIN, termios.tcgetattr(fd))
+  tty.setcbreak(fd)
   print('Press q to quit:')
-  while (True):
-      # Receive keyboard input from user.
-      input_str = input()
-
-      # Enqueue this input string.
-      # Note: Lock not required here since we are only calling a single Queue method, not a sequence of them 
-      # which would otherwise need to be treated as one atomic operation.
-      inputQueue.put(input_str)
+
+def read_kbd_input(timeout):
+  # Return the next key pressed, or None if nothing was pressed within timeout seconds.
+  if not sys.stdin.isatty():
+    time.sleep(timeout)
+    return None
+  if select.select([sys.stdin], [], [], timeout)[0]:
+    return os.read(sys.stdin.fileno(), 1).decode()
+  return None
  
 def main():
   camera = picamera.PiCamera()
@@ -25,29 +41,20 @@ def main():
   dt = datetime.datetime.now()
   output_file = f"{dt.year}-{dt.month}-{dt.day}_{dt.hour}h{dt.minute}m{dt.second}s.h264"
 
-  # Keyboard input queue to pass data from the thread reading the keyboard inputs to the main thread.
-  inputQueue = queue.Queue()
-
-  # Create & start a thread to read keyboard inputs.
-  # Set daemon to True to auto-kill this thread when all other non-daemonic threads are exited. This is desired since
-  # this thread has no cleanup to do, which would otherwise require a more graceful approach to clean up then exit.
-  inputThread = threading.Thread(target=read_kbd_input, args=(inputQueue,), daemon=True)
-  inputThread.start()
-
-  camera.start_recording(output_file)
-
-  terminated = False # Sets initial condition on while loop
+  # Keyboard input is polled from the main loop.
+  setup_kbd_input()
 
-  while not terminated:
-    # if the keyboard input has been entered, check input
-    if inputQueue.qsize() > 0:
-      input_str = inputQueue.get()
+  # The GPU's H.264 encoder does all of the work. Inline headers and a key frame every frame keep its buffering low.
+  camera.start_recording(output_file, format='h264', splitter_port=1, bitrate=10000000, inline_headers=True, profile='baseline', intra_period=1)
 
-      # If user entered a q, quit the program
-      if input_str == "q":
-        terminated = True
+  # Block until the user enters a q (or hits Ctrl+C), checking the recording for errors in between
+  try:
+    while read_kbd_input(0.5) != "q":
+      camera.wait_recording(0, splitter_port=1)
+  except KeyboardInterrupt:
+    pass
 
-  camera.stop_recording()
+  camera.stop_recording(splitter_port=1)
   print("Finished recording")
 
 if __name__ == "__main__":
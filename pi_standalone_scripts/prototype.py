@@ -2,7 +2,13 @@ import cv2
 import numpy as np
 import datetime
 import threading
-import queue
+import sys
+import time
+import os
+import atexit
+import select
+import termios
+import tty
 
 def make_1080p(video):
   video.set(3, 1920)
@@ -16,81 +22,155 @@ def make_480p(video):
    video.set(3, 640)
    video.set(4, 480)
 
-def read_kbd_input(inputQueue):
+def gstreamer_pipeline(output_file, encoder):
+  # Raw frames are pushed through appsrc straight into an H.264 encoder, so no encoding happens in the Python loop.
+  # is-live/max-latency keep appsrc from queueing frames and a key frame every frame keeps encoder buffering at zero.
+  return ("appsrc is-live=true stream-type=0 max-latency=1 ! videoconvert ! video/x-raw,format=I420 ! "
+          f"{encoder} ! h264parse ! matroskamux ! filesink location={output_file}")
+
+def open_writer(output_file, fps, frame_size):
+  # Prefer the Pi's hardware encoder, fall back to x264 in software on machines that don't have one.
+  encoders = [
+    'v4l2h264enc extra-controls="controls,h264_i_frame_period=1"',
+    'x264enc tune=zerolatency speed-preset=ultrafast key-int-max=1',
+  ]
+  for encoder in encoders:
+    out = cv2.VideoWriter(gstreamer_pipeline(output_file, encoder), cv2.CAP_GSTREAMER, 0, fps, frame_size, True)
+    if out.isOpened():
+      return out
+  return out
+
+class FreshestFrame(threading.Thread):
+  # Continuously drains the camera so the main loop always gets the most recent frame instead of a stale buffered one.
+  def __init__(self, capture):
+    super().__init__(daemon=True)
+    self.capture = capture
+    self.lock = threading.Condition()
+    self.frame = None
+    self.count = 0
+    self.running = True
+    self.start()
+
+  def run(self):
+    while self.running:
+      ret = self.capture.grab()
+      if ret == True:
+        ret, frame = self.capture.retrieve()
+
+      with self.lock:
+        # retrieve() hands back a new array every time, so the reader can keep the old one without a copy
+        self.frame = frame if ret == True else None
+        self.count = self.count + 1
+        if ret == False:
+          self.running = False
+        self.lock.notify_all()
+
+  # Wait for a frame newer than seen_count and return it along with its count. The frame is None once capture fails.
+  def read(self, seen_count=0):
+    with self.lock:
+      self.lock.wait_for(lambda: self.count > seen_count or not self.running)
+      return self.count, self.frame
+
+  def release(self):
+    self.running = False
+    self.join()
+
+def setup_kbd_input():
+  # Without a terminal (nohup, ssh without -t, a service) there is no keyboard to read, stop with Ctrl+C or SIGINT instead.
+  if not sys.stdin.isatty():
+    print('No terminal attached, keyboard input disabled')
+    return
+
+  # Put the terminal in cbreak mode so single key presses can be read without waiting for enter.
+  # The original settings are restored when the program exits.
+  fd = sys.stdin.fileno()
+  atexit.register(termios.tcsetattr, fd, termios.TCSADRAIN, termios.tcgetattr(fd))
+  tty.setcbreak(fd)
   print('Press q to quit:')
-  while (True):
-      # Receive keyboard input from user.
-      input_str = input()
-
-      # Enqueue this input string.
-      # Note: Lock not required here since we are only calling a single Queue method, not a sequence of them 
-      # which would otherwise need to be treated as one atomic operation.
-      inputQueue.put(input_str)
+
+def read_kbd_input(timeout):
+  # Return the next key pressed, or None if nothing was pressed within timeout seconds.
+  if not sys.stdin.isatty():
+    time.sleep(timeout)
+    return None
+  if select.select([sys.stdin], [], [], timeout)[0]:
+    return os.read(sys.stdin.fileno(), 1).decode()
+  return None
  
 def main():
-  # Create a VideoCapture object
-  cap = cv2.VideoCapture(0)
+  # Create a VideoCapture object using V4L2 directly
+  cap = cv2.VideoCapture(0, cv2.CAP_V4L2)
   
   # Check if camera opened successfully
   if (cap.isOpened() == False):
     print("Unable to read camera feed")
+
+  # Ask for MJPG from the camera before anything else, most V4L2 drivers ignore high frame rates in the default YUYV mode.
+  cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc('M','J','P','G'))
+
+  # Keep a single buffer in the driver so grabbed frames are never stale.
+  cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
   
-  # Change default resolution of the system.
+  # Change default resolution and frame rate of the system.
   make_480p(cap)
+  cap.set(cv2.CAP_PROP_FPS, 90)
 
-  # Default resolutions of the frame are obtained.The default resolutions are system dependent.
+  # The resolution and frame rate actually negotiated are read back, since the driver may not honour the request.
   # We convert the resolutions from float to integer.
   frame_width = int(cap.get(3))
   frame_height = int(cap.get(4))
   fps = cap.get(cv2.CAP_PROP_FPS)
-  cap.set(cv2.CAP_PROP_FPS, 90)
   print("Framerate = %0.2f FPS" % (fps))
 
   # Get current datetime and compose output video file name.
   dt = datetime.datetime.now()
-  output_file = f"{dt.year}-{dt.month}-{dt.day}_{dt.hour}:{dt.minute}:{dt.second}.avi"
+  output_file = f"{dt.year}-{dt.month}-{dt.day}_{dt.hour}:{dt.minute}:{dt.second}.mkv"
   
-  # Define the codec and create VideoWriter object.The output is stored in 'outpy.avi' file.
-  out = cv2.VideoWriter(output_file,cv2.VideoWriter_fourcc('M','J','P','G'), 30, (frame_width,frame_height))
+  # Create the GStreamer backed VideoWriter object at the resolution the camera negotiated.
+  out = open_writer(output_file, fps, (frame_width,frame_height))
+  if (out.isOpened() == False):
+    print("Unable to open H.264 encoder pipeline")
 
-  # Keyboard input queue to pass data from the thread reading the keyboard inputs to the main thread.
-  inputQueue = queue.Queue()
+  # Keyboard input is polled from the main loop.
+  setup_kbd_input()
 
-  # Create & start a thread to read keyboard inputs.
-  # Set daemon to True to auto-kill this thread when all other non-daemonic threads are exited. This is desired since
-  # this thread has no cleanup to do, which would otherwise require a more graceful approach to clean up then exit.
-  inputThread = threading.Thread(target=read_kbd_input, args=(inputQueue,), daemon=True)
-  inputThread.start()
+  # Start grabbing frames in the background.
+  grabber = FreshestFrame(cap)
 
   terminated = False # Sets initial condition on while loop
 
   frame_count = 0
+  seen_count = 0
 
-  while not terminated:
-    # wait before each frame is written. wait is relative to fps
-    cv2.waitKey(int(1000 / fps))
-    frame_count = frame_count + 1
+  # Ctrl+C also stops the recording cleanly, which is the only way out when no terminal is attached
+  try:
+    while not terminated:
+      frame_count = frame_count + 1
 
-    ret, frame = cap.read()
+      # Wait for the next frame, the camera sets the pace
+      seen_count, frame = grabber.read(seen_count)
   
-    if ret == True: 
+      if frame is not None: 
       
-      # Write the frame into the file
-      out.write(frame)
+        # Write the frame into the file
+        out.write(frame)
   
-    # Break the loop
-    else:
-      terminated = True
+      # Break the loop
+      else:
+        terminated = True
 
-    # if the keyboard input has been entered, check input
-    if inputQueue.qsize() > 0:
-      input_str = inputQueue.get()
+      # if a key has been pressed, check input without blocking
+      input_str = read_kbd_input(0)
+      if input_str is not None:
 
-      # If user entered a q, quit the program
-      if input_str == "q":
-        terminated = True
+        # If user entered a q, quit the program
+        if input_str == "q":
+          terminated = True
+  except KeyboardInterrupt:
+    pass
   
-  # When everything done, release the video capture and video write objects
+  # When everything done, release the grabber, video capture and video write objects
+  grabber.release()
   cap.release()
   out.release()
   
@@ -5,6 +5,9 @@
 #include "constellations.h"
 #include "beast.h"
 %}
+//lets star_db::add_stars take python sequences (and numpy arrays)
+%include "std_vector.i"
+%template(float_vector) std::vector<float>;
 //newobject gives python control of these objects
 %newobject star_db::copy;
 %newobject star_db::copy_n_brightest;
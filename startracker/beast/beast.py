@@ -61,6 +61,173 @@ class _SwigNonDynamicMeta(type):
     __setattr__ = _swig_setattr_nondynamic_class_variable(type.__setattr__)
 
 
+class SwigPyIterator(object):
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+
+    def __init__(self, *args, **kwargs):
+        raise AttributeError("No constructor defined - class is abstract")
+    __repr__ = _swig_repr
+    __swig_destroy__ = _beast.delete_SwigPyIterator
+
+    def value(self) -> "PyObject *":
+        return _beast.SwigPyIterator_value(self)
+
+    def incr(self, n: "size_t"=1) -> "swig::SwigPyIterator *":
+        return _beast.SwigPyIterator_incr(self, n)
+
+    def decr(self, n: "size_t"=1) -> "swig::SwigPyIterator *":
+        return _beast.SwigPyIterator_decr(self, n)
+
+    def distance(self, x: "SwigPyIterator") -> "ptrdiff_t":
+        return _beast.SwigPyIterator_distance(self, x)
+
+    def equal(self, x: "SwigPyIterator") -> "bool":
+        return _beast.SwigPyIterator_equal(self, x)
+
+    def copy(self) -> "swig::SwigPyIterator *":
+        return _beast.SwigPyIterator_copy(self)
+
+    def next(self) -> "PyObject *":
+        return _beast.SwigPyIterator_next(self)
+
+    def __next__(self) -> "PyObject *":
+        return _beast.SwigPyIterator___next__(self)
+
+    def previous(self) -> "PyObject *":
+        return _beast.SwigPyIterator_previous(self)
+
+    def advance(self, n: "ptrdiff_t") -> "swig::SwigPyIterator *":
+        return _beast.SwigPyIterator_advance(self, n)
+
+    def __eq__(self, x: "SwigPyIterator") -> "bool":
+        return _beast.SwigPyIterator___eq__(self, x)
+
+    def __ne__(self, x: "SwigPyIterator") -> "bool":
+        return _beast.SwigPyIterator___ne__(self, x)
+
+    def __iadd__(self, n: "ptrdiff_t") -> "swig::SwigPyIterator &":
+        return _beast.SwigPyIterator___iadd__(self, n)
+
+    def __isub__(self, n: "ptrdiff_t") -> "swig::SwigPyIterator &":
+        return _beast.SwigPyIterator___isub__(self, n)
+
+    def __add__(self, n: "ptrdiff_t") -> "swig::SwigPyIterator *":
+        return _beast.SwigPyIterator___add__(self, n)
+
+    def __sub__(self, *args) -> "ptrdiff_t":
+        return _beast.SwigPyIterator___sub__(self, *args)
+    def __iter__(self):
+        return self
+
+# Register SwigPyIterator in _beast:
+_beast.SwigPyIterator_swigregister(SwigPyIterator)
+
+class float_vector(object):
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def iterator(self) -> "swig::SwigPyIterator *":
+        return _beast.float_vector_iterator(self)
+    def __iter__(self):
+        return self.iterator()
+
+    def __nonzero__(self) -> "bool":
+        return _beast.float_vector___nonzero__(self)
+
+    def __bool__(self) -> "bool":
+        return _beast.float_vector___bool__(self)
+
+    def __len__(self) -> "std::vector< float >::size_type":
+        return _beast.float_vector___len__(self)
+
+    def __getslice__(self, i: "std::vector< float >::difference_type", j: "std::vector< float >::difference_type") -> "std::vector< float,std::allocator< float > > *":
+        return _beast.float_vector___getslice__(self, i, j)
+
+    def __setslice__(self, *args) -> "void":
+        return _beast.float_vector___setslice__(self, *args)
+
+    def __delslice__(self, i: "std::vector< float >::difference_type", j: "std::vector< float >::difference_type") -> "void":
+        return _beast.float_vector___delslice__(self, i, j)
+
+    def __delitem__(self, *args) -> "void":
+        return _beast.float_vector___delitem__(self, *args)
+
+    def __getitem__(self, *args) -> "std::vector< float >::value_type const &":
+        return _beast.float_vector___getitem__(self, *args)
+
+    def __setitem__(self, *args) -> "void":
+        return _beast.float_vector___setitem__(self, *args)
+
+    def pop(self) -> "std::vector< float >::value_type":
+        return _beast.float_vector_pop(self)
+
+    def append(self, x: "std::vector< float >::value_type const &") -> "void":
+        return _beast.float_vector_append(self, x)
+
+    def empty(self) -> "bool":
+        return _beast.float_vector_empty(self)
+
+    def size(self) -> "std::vector< float >::size_type":
+        return _beast.float_vector_size(self)
+
+    def swap(self, v: "float_vector") -> "void":
+        return _beast.float_vector_swap(self, v)
+
+    def begin(self) -> "std::vector< float >::iterator":
+        return _beast.float_vector_begin(self)
+
+    def end(self) -> "std::vector< float >::iterator":
+        return _beast.float_vector_end(self)
+
+    def rbegin(self) -> "std::vector< float >::reverse_iterator":
+        return _beast.float_vector_rbegin(self)
+
+    def rend(self) -> "std::vector< float >::reverse_iterator":
+        return _beast.float_vector_rend(self)
+
+    def clear(self) -> "void":
+        return _beast.float_vector_clear(self)
+
+    def get_allocator(self) -> "std::vector< float >::allocator_type":
+        return _beast.float_vector_get_allocator(self)
+
+    def pop_back(self) -> "void":
+        return _beast.float_vector_pop_back(self)
+
+    def erase(self, *args) -> "std::vector< float >::iterator":
+        return _beast.float_vector_erase(self, *args)
+
+    def __init__(self, *args):
+        _beast.float_vector_swiginit(self, _beast.new_float_vector(*args))
+
+    def push_back(self, x: "std::vector< float >::value_type const &") -> "void":
+        return _beast.float_vector_push_back(self, x)
+
+    def front(self) -> "std::vector< float >::value_type const &":
+        return _beast.float_vector_front(self)
+
+    def back(self) -> "std::vector< float >::value_type const &":
+        return _beast.float_vector_back(self)
+
+    def assign(self, n: "std::vector< float >::size_type", x: "std::vector< float >::value_type const &") -> "void":
+        return _beast.float_vector_assign(self, n, x)
+
+    def resize(self, *args) -> "void":
+        return _beast.float_vector_resize(self, *args)
+
+    def insert(self, *args) -> "void":
+        return _beast.float_vector_insert(self, *args)
+
+    def reserve(self, n: "std::vector< float >::size_type") -> "void":
+        return _beast.float_vector_reserve(self, n)
+
+    def capacity(self) -> "std::vector< float >::size_type":
+        return _beast.float_vector_capacity(self)
+    __swig_destroy__ = _beast.delete_float_vector
+
+# Register float_vector in _beast:
+_beast.float_vector_swigregister(float_vector)
+
 PI = _beast.PI
 TWOPI = _beast.TWOPI
 
@@ -143,6 +310,9 @@ class star_db(object):
     def __iadd__(self, *args) -> "star_db *":
         return _beast.star_db___iadd__(self, *args)
 
+    def add_stars(self, px: "float_vector", py: "float_vector", flux: "float_vector") -> "void":
+        return _beast.star_db_add_stars(self, px, py, flux)
+
     def __sub__(self, s: "star_db") -> "star_db *":
         return _beast.star_db___sub__(self, s)
 
@@ -11,6 +11,7 @@
 #include <map>
 #include <unordered_map>
 #include <iterator>     // std::next
+#include <vector>
 
 
 //Sadness inducing bit twiddling stuff
@@ -224,6 +225,17 @@ public:
 	}
 	star_db* OP(const star& s) { return *this+=&s;}
 	#undef OP
+	/**
+	* @brief add image stars in bulk, same as doing +=star(px[i],py[i],flux[i],-1) for each i
+	*
+	* @param px Pixel x minus camera center
+	* @param py Pixel y minus camera center
+	* @param flux Pixel brightness
+	*/
+	void add_stars(const std::vector<float> &px, const std::vector<float> &py, const std::vector<float> &flux) {
+		size_t n=std::min(px.size(),std::min(py.size(),flux.size()));
+		for (size_t i=0;i<n;i++) (*this)+=star(px[i],py[i],flux[i],-1);
+	}
 	#define OP operator-
 	star_db* OP(star_db* s) {
 		star_db* r = new star_db;
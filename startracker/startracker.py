@@ -10,6 +10,7 @@ import threading
 import glob
 import random
 import logging
+from contextlib import contextmanager
 
 # Imports - external
 import numpy as np
@@ -28,11 +29,21 @@ logger = logging.getLogger("org.OreSat.StarTracker")
 journald_handler = journal.JournalHandler()
 journald_handler.setFormatter(logging.Formatter('[%(levelname)s] %(message)s'))
 logger.addHandler(journald_handler)
-logger.setLevel(logging.DEBUG)
 
 # CUSTOM DEBUG VARIABLES
-DEBUG_ENABLED = True
-STACK_LAYERS = 0
+# With debugging off the logger stays at INFO and the trace calls below return straight away
+DEBUG_ENABLED = False
+logger.setLevel(logging.DEBUG if DEBUG_ENABLED else logging.INFO)
+LOG = logger.debug
+
+# Trace entry and exit of a block, also usable as a method decorator
+@contextmanager
+def _trace(name):
+    LOG("enter %s", name)
+    try:
+        yield
+    finally:
+        LOG("exit %s", name)
 
 # Solver
 class StarTracker:
@@ -45,26 +56,30 @@ class StarTracker:
         self.YEAR = 1991.25
         self.SAMPLE_DIR = None
         self.MEDIAN_IMAGE = None
+        self.DIFF_BUF = None
+        self.GREY_BUF = None
+        self.THRESH_BUF = None
         self.S_DB = None
         self.SQ_RESULTS = None
         self.S_FILTERED = None
         self.C_DB = None
 
     # Startup sequence
+    @_trace("StarTracker.startup")
     def startup(self, median_path, config_path, db_path, sample_dir = None):
 
-        if(DEBUG_ENABLED):
-            global STACK_LAYERS
-            print(f"{STACK_LAYERS * ' '}Inside StarTracker.startup")
-            STACK_LAYERS = STACK_LAYERS + 1
-
         # Set the sample directory
         logger.info("Beginning startup sequence...")
         self.SAMPLE_DIR = sample_dir
 
         # Prepare star tracker
-        self.MEDIAN_IMAGE = cv2.imread(median_path)
+        self.MEDIAN_IMAGE = cv2.cvtColor(cv2.imread(median_path), cv2.COLOR_RGB2GRAY)
         logger.info("Loaded median image from {}".format(median_path))
+
+        # Preallocate the per-frame image buffers used by solve
+        self.GREY_BUF = np.empty_like(self.MEDIAN_IMAGE)
+        self.DIFF_BUF = np.empty_like(self.MEDIAN_IMAGE)
+        self.THRESH_BUF = np.empty_like(self.MEDIAN_IMAGE)
         beast.load_config(config_path)
         logger.info("Loaded configuration from {}".format(config_path))
         self.S_DB = beast.star_db()
@@ -78,43 +93,22 @@ class StarTracker:
         self.C_DB = beast.constellation_db(self.S_FILTERED, 2 + beast.cvar.DB_REDUNDANCY, 0)
         logger.info("Startup sequence complete!")
 
-        if(DEBUG_ENABLED):
-            STACK_LAYERS = STACK_LAYERS - 1
-            print(f"{STACK_LAYERS * ' '}End StarTracker.startup")
-
     # Capture an image, or pull one from the sample directory
     def capture(self):
 
-        if(DEBUG_ENABLED):
-            global STACK_LAYERS
-            print(f"{STACK_LAYERS * ' '}Inside StarTracker.capture")
-            STACK_LAYERS = STACK_LAYERS + 1
-
         # Pull from sample directory
         if self.SAMPLE_DIR != None:
             path = random.choice(glob.glob(self.SAMPLE_DIR + "*"))
 
-            if(DEBUG_ENABLED):
-                STACK_LAYERS = STACK_LAYERS - 1
-                print(f"{STACK_LAYERS * ' '}End StarTracker.capture")
-
             return path, cv2.imread(path)
 
-        if(DEBUG_ENABLED):
-            STACK_LAYERS = STACK_LAYERS - 1
-            print(f"{STACK_LAYERS * ' '}End StarTracker.capture")
-
         # Capture an image
         return None, None
 
     # See if an image is worth attempting to solve
+    @_trace("StarTracker.preprocess")
     def preprocess(self, img):
 
-        if(DEBUG_ENABLED):
-            global STACK_LAYERS
-            print(f"{STACK_LAYERS * ' '}Inside StarTracker.preprocess")
-            STACK_LAYERS = STACK_LAYERS + 1
-
         # Generate test parameters
         height, width, channels = img.shape
         total_pixels = height * width
@@ -130,7 +124,10 @@ class StarTracker:
 
         # Check the test values and return appropriate value
         if threshold_black > blur_check:
-            blur = cv2.Laplacian(img, cv2.CV_64F).var()
+            # float32 is plenty for a variance and halves the memory traffic, meanStdDev gets it in a single pass
+            lap = cv2.Laplacian(img, cv2.CV_32F)
+            mean, sigma = cv2.meanStdDev(lap)
+            blur = float(sigma[0, 0]) ** 2
             if blur != 0 and blur < 5:
                 return "image too blurry"
             else:
@@ -139,77 +136,87 @@ class StarTracker:
         elif threshold_black < too_many_check:
             return "unsuitable image"
 
-        if(DEBUG_ENABLED):
-            STACK_LAYERS = STACK_LAYERS - 1
-            print(f"{STACK_LAYERS * ' '}End StarTracker.preprocess")
-
         return "good"
 
     # Solution function
+    @_trace("StarTracker.solve")
     def solve(self, orig_img):
 
-        if(DEBUG_ENABLED):
-            global STACK_LAYERS
-            print(f"{STACK_LAYERS * ' '}Inside StarTracker.solve")
-            STACK_LAYERS = STACK_LAYERS + 1
-
         # Keep track of solution time
         starttime = time.time()
 
+        # Read the beast config once, every cvar access goes through SWIG
+        thresh_val = beast.cvar.THRESH_FACTOR * beast.cvar.IMAGE_VARIANCE
+        half_x = beast.cvar.IMG_X / 2.0
+        half_y = beast.cvar.IMG_Y / 2.0
+        required_stars = beast.cvar.REQUIRED_STARS
+        n_keep = beast.cvar.MAX_FALSE_STARS + required_stars
+        max_false_p2 = beast.cvar.MAX_FALSE_STARS + 2
+
         # Create and initialize variables
         img_stars = beast.star_db()
         match = None
         fov_db = None
 
-        # Process the image for solving
-        img = np.clip(orig_img.astype(np.int16) - self.MEDIAN_IMAGE, a_min = 0, a_max = 255).astype(np.uint8)
-        img_grey = cv2.cvtColor(img, cv2.COLOR_RGB2GRAY)
+        # Process the image for solving on a single channel (subtract saturates at 0, and every step writes into a preallocated buffer)
+        grey = cv2.cvtColor(orig_img, cv2.COLOR_RGB2GRAY, dst = self.GREY_BUF)
+        img_grey = cv2.subtract(grey, self.MEDIAN_IMAGE, dst = self.DIFF_BUF)
 
-        # Remove areas of the image that don't meet our brightness threshold and then extract contours
-        ret, thresh = cv2.threshold(img_grey, beast.cvar.THRESH_FACTOR * beast.cvar.IMAGE_VARIANCE, 255, cv2.THRESH_BINARY)
-        contours, hierarchy = cv2.findContours(thresh, 1, 2);
+        # Remove areas of the image that don't meet our brightness threshold
+        ret, thresh = cv2.threshold(img_grey, thresh_val, 255, cv2.THRESH_BINARY, dst = self.THRESH_BUF)
 
-        # Process the contours
-        for c in contours:
+        # Label each star blob and get its area and centroid (label 0 is the background)
+        n_labels, labels, stats, centroids = cv2.connectedComponentsWithStats(thresh, connectivity = 8, ltype = cv2.CV_32S)
 
-            M = cv2.moments(c)
+        # Blobs one pixel wide or tall (hot pixels, pairs, short streaks) are noise, cv2.moments gave their contours an area of 0
+        # so they were never stars. Diagonal chains of single pixels also had an area of 0 but still pass this check.
+        blobs = (stats[1:, cv2.CC_STAT_WIDTH] > 1) & (stats[1:, cv2.CC_STAT_HEIGHT] > 1)
 
-            if M["m00"] > 0:
+        # this is how the x and y position are defined by cv2
+        cx = centroids[1:, 0][blobs]
+        cy = centroids[1:, 1][blobs]
 
-                # this is how the x and y position are defined by cv2
-                cx = M["m10"] / M["m00"]
-                cy = M["m01"] / M["m00"]
+        # Add all of the blobs to the star database in one call
+        if cx.size > 0:
 
-                # see https://alyssaq.github.io/2015/computing-the-axes-or-orientation-of-a-blob/ for how to convert these into eigenvectors/values
-                u20 = M["m20"] / M["m00"] - cx ** 2
-                u02 = M["m02"] / M["m00"] - cy ** 2
-                u11 = M["m11"] / M["m00"] - cx * cy
+            # The center pixel is used as the approximation of the brightest pixel
+            height, width = img_grey.shape
+            px = np.clip((cx + 0.5).astype(np.intp), 0, width - 1)
+            py = np.clip((cy + 0.5).astype(np.intp), 0, height - 1)
+            flux = img_grey[py, px]
+            img_stars.add_stars(cx - half_x, cy - half_y, flux.astype(np.float64))
 
-                # The center pixel is used as the approximation of the brightest pixel
-                img_stars += beast.star(cx - beast.cvar.IMG_X / 2.0, cy - beast.cvar.IMG_Y / 2.0, float(cv2.getRectSubPix(img_grey, (1,1), (cx,cy))[0,0]), -1)
+        # Make sure no kd search results are left over from an earlier solve
+        self.SQ_RESULTS.clear_kdresults()
+        self.C_DB.results.clear_kdresults()
 
         # We only want to use the brightest MAX_FALSE_STARS + REQUIRED_STARS
-        img_stars_n_brightest = img_stars.copy_n_brightest(beast.cvar.MAX_FALSE_STARS + beast.cvar.REQUIRED_STARS)
-        img_const_n_brightest = beast.constellation_db(img_stars_n_brightest, beast.cvar.MAX_FALSE_STARS + 2, 1)
+        # If there aren't more stars than that, this is the same constellation_db as the full image one, so it is built once and reused
+        all_stars_kept = img_stars.size() <= n_keep
+        if all_stars_kept:
+            img_const_n_brightest = beast.constellation_db(img_stars, max_false_p2, 1)
+        else:
+            img_stars_n_brightest = img_stars.copy_n_brightest(n_keep)
+            img_const_n_brightest = beast.constellation_db(img_stars_n_brightest, max_false_p2, 1)
         lis = beast.db_match(self.C_DB, img_const_n_brightest)
 
         # Generate the match
-        if lis.p_match > self.P_MATCH_THRESH and lis.winner.size() >= beast.cvar.REQUIRED_STARS:
+        if lis.p_match > self.P_MATCH_THRESH and lis.winner.size() >= required_stars:
 
             x = lis.winner.R11
             y = lis.winner.R21
             z = lis.winner.R31
             r = beast.cvar.MAXFOV / 2
-            self.SQ_RESULTS.kdsearch(x, y, z, r, beast.cvar.THRESH_FACTOR * beast.cvar.IMAGE_VARIANCE)
+            self.SQ_RESULTS.kdsearch(x, y, z, r, thresh_val)
 
             # Estimate density for constellation generation
-            self.C_DB.results.kdsearch(x, y, z, r,beast.cvar.THRESH_FACTOR * beast.cvar.IMAGE_VARIANCE)
+            self.C_DB.results.kdsearch(x, y, z, r, thresh_val)
             fov_stars = self.SQ_RESULTS.from_kdresults()
             fov_db = beast.constellation_db(fov_stars, self.C_DB.results.r_size(), 1)
             self.C_DB.results.clear_kdresults()
             self.SQ_RESULTS.clear_kdresults()
 
-            img_const = beast.constellation_db(img_stars, beast.cvar.MAX_FALSE_STARS + 2, 1)
+            img_const = img_const_n_brightest if all_stars_kept else beast.constellation_db(img_stars, max_false_p2, 1)
             near = beast.db_match(fov_db, img_const)
 
             if near.p_match > self.P_MATCH_THRESH:
@@ -230,43 +237,22 @@ class StarTracker:
         # Calculate how long it took to process
         runtime = time.time() - starttime
 
-        if(DEBUG_ENABLED):
-            STACK_LAYERS = STACK_LAYERS - 1
-            print(f"{STACK_LAYERS * ' '}End StarTracker.solve")
-
         # Return solution
-        return dec, ra, ori, time
+        return dec, ra, ori, runtime
 
     # Camera control
     def modify(self, mod_string):
-        if(DEBUG_ENABLED):
-            global STACK_LAYERS
-            print(f"{STACK_LAYERS * ' '}Inside StarTracker.modify")
-            STACK_LAYERS = STACK_LAYERS + 1
-
-        if(DEBUG_ENABLED):
-            STACK_LAYERS = STACK_LAYERS - 1
-            print(f"{STACK_LAYERS * ' '}End StarTracker.modify")
-
         return 0
 
     # Error processing
+    @_trace("StarTracker.error")
     def error(self, err_string):
-        if(DEBUG_ENABLED):
-            global STACK_LAYERS
-            print(f"{STACK_LAYERS * ' '}Inside StarTracker.error")
-            STACK_LAYERS = STACK_LAYERS + 1
-
         # Handle what we can handle, everything else will be ignored
         if err_string == "image too blurry":
             self.modify("more sharp")
         elif err_string == "image contains too few stars":
             self.modify("increase gain")
 
-        if(DEBUG_ENABLED):
-            STACK_LAYERS = STACK_LAYERS - 1
-            print(f"{STACK_LAYERS * ' '}End StarTracker.error")
-
         # We always handle successfully
         return 0
 
@@ -306,6 +292,10 @@ class StarTrackerServer:
         self.p_solve = ""
         self.interface_name = "org.OreSat.StarTracker"
 
+        # Property signal throttling
+        self.pending_props = None
+        self.last_emit = 0.0
+
         # Set up star tracker solver
         self.st = StarTracker()
         self.st_thread = threading.Thread(target = self.star_tracker)
@@ -314,60 +304,65 @@ class StarTrackerServer:
 
     # Star tracker thread
     def star_tracker(self):
-        if(DEBUG_ENABLED):
-            global STACK_LAYERS
-            print(f"{STACK_LAYERS * ' '}Inside Server.star_tracker")
-            STACK_LAYERS = STACK_LAYERS + 1
-
         # Keep going while we're running
         while (self.st_running):
 
             # Capture an image
-            self.st_lock.acquire()
-            self.p_solve, img = self.st.capture()
-            # self.PropertiesChanged(self.interface_name, {"filepath": self.p_solve}, [])
+            path, img = self.st.capture()
 
             # Check the image
             check = self.st.preprocess(img)
             if check != "good":
+                with self.st_lock:
+                    self.p_solve = path
                 self.st.error(check)
-                logger.warning(check + "(for {})".format(p_solve))
-                error(check)
+                logger.warning(check + "(for {})".format(path))
+                self.error(check)
                 time.sleep(0.5)
                 continue
 
-            # Solve the image
-            self.dec, self.ra, self.ori, self.l_solve = self.st.solve(img)
-            # self.PropertiesChanged(self.interface_name, {"coor": self.dec}, []) #TODO need to handle the struct
-            if self.dec == self.ra == self.ori == 0.0:
+            # Solve the image, only holding the lock while the results are stored
+            dec, ra, ori, l_solve = self.st.solve(img)
+            with self.st_lock:
+                self.p_solve = path
+                self.dec, self.ra, self.ori, self.l_solve = dec, ra, ori, l_solve
+
+                # Update the solution timestamp
+                if not dec == ra == ori == 0.0:
+                    self.t_solve = time.time()
+                t_solve = self.t_solve
+
+            if dec == ra == ori == 0.0:
                 self.st.error("bad solve")
-                logger.error("bad solve (for {})".format(p_solve))
-                error("bad solve")
+                logger.error("bad solve (for {})".format(path))
+                self.error("bad solve")
                 time.sleep(0.5)
                 continue
 
-            # Update the solution timestamp
-            self.t_solve = time.time()
-            self.st_lock.release()
-
-            # Send property signal
-            self.PropertiesChanged(self.interface_name, {"filepath": self.p_solve}, [])
-            time.sleep(0.5)
-
-        if(DEBUG_ENABLED):
-            STACK_LAYERS = STACK_LAYERS - 1
-            print(f"{STACK_LAYERS * ' '}End Server.star_tracker")
+            # Send both properties in one signal, at most every 0.1 s
+            # Solves that come in sooner replace the pending change, which is sent from the D-Bus loop once the window is over
+            with self.st_lock:
+                schedule = self.pending_props is None
+                self.pending_props = {"coor": (dec, ra, ori, t_solve), "filepath": path}
+                delay = max(0.0, 0.1 - (time.time() - self.last_emit))
+            if schedule:
+                GLib.timeout_add(int(delay * 1000), self.emit_properties)
+
+    # Send the pending property change, runs on the D-Bus loop
+    def emit_properties(self):
+        with self.st_lock:
+            changed = self.pending_props
+            self.pending_props = None
+            self.last_emit = time.time()
+        self.PropertiesChanged(self.interface_name, changed, [])
+
+        # Only run once per timeout_add
+        return False
 
     # Start up solver and server
     def start(self, median_path, config_path, db_path, sample_dir = None):
-        if(DEBUG_ENABLED):
-            global STACK_LAYERS
-            print(f"{STACK_LAYERS * ' '}Inside Server.start")
-            STACK_LAYERS = STACK_LAYERS + 1
-
         # Start up star tracker
         self.st.startup(median_path, config_path, db_path, sample_dir = sample_dir)
-        time.sleep(20)
         self.st_thread.start()
         logger.info("Started worker thread")
 
@@ -383,25 +378,12 @@ class StarTrackerServer:
             logger.info("Ended D-Bus loop")
             self.end()
 
-        if(DEBUG_ENABLED):
-            STACK_LAYERS = STACK_LAYERS - 1
-            print(f"{STACK_LAYERS * ' '}End Server.start")
-
     # Stop threads in preparation to exit
     def end(self):
-        if(DEBUG_ENABLED):
-            global STACK_LAYERS
-            print(f"{STACK_LAYERS * ' '}Inside Server.end")
-            STACK_LAYERS = STACK_LAYERS + 1
-
         self.st_running = False
         if self.st_thread.is_alive():
             self.st_thread.join()
 
-        if(DEBUG_ENABLED):
-            STACK_LAYERS = STACK_LAYERS - 1
-            print(f"{STACK_LAYERS * ' '}End Server.end")
-
     # Coordinates
     @property
     def coor(self):
@@ -422,7 +404,7 @@ class StarTrackerServer:
     @property
     def last_solve(self):
         self.st_lock.acquire()
-        p_solve = p_solve
+        p_solve = self.p_solve
         dec, ra, ori, t_solve = self.dec, self.ra, self.ori, self.t_solve
         self.st_lock.release()
         return (dec, ra, ori, t_solve, p_solve)